@@ -1,8 +1,22 @@
 # This package is for additional application modules.
+from collections import defaultdict
+from functools import lru_cache
+from itertools import accumulate
+
 from kivy.core.text import Label
 from kivy.metrics import sp
 
 
+@lru_cache(maxsize=None)
+def _get_text_width(font_size):
+    return Label(font_size=font_size).get_cached_extents()
+
+
+@lru_cache(maxsize=4096)
+def _measure(font_size, text):
+    return _get_text_width(font_size)(text)[0]
+
+
 def shorten_text(text, lbl_width, lines=1, suffix="... See more", font_size=sp(12)):
     """
     Used to shorten text in kivy to number of lines you want unlike kivy which only shortens for
@@ -15,27 +29,59 @@ def shorten_text(text, lbl_width, lines=1, suffix="... See more", font_size=sp(1
     :param font_size: font_size of the original label containing the text to shorten
     :return: returns shorten text
     """
-    lbl = Label(font_size=font_size)
-    new_text = text
-    text_width = lbl.get_cached_extents()
-    t = 0
     lbl_width *= lines
     if lbl_width <= 0:
         return ""
-    while text_width(new_text + suffix + " more")[0] > lbl_width:
-        new_text = new_text.split(" ")
-        del new_text[-1]
-        new_text = " ".join(new_text)
-        if text_width(new_text + suffix + " more")[0] == t:
-            return ""
-        t = text_width(new_text + suffix + " more")[0]
-    return new_text + suffix
+    # The suffix is measured once; the remaining width is what the text
+    # itself may occupy.
+    max_width = lbl_width - _measure(font_size, suffix + " more")
+    # Offset just past each word, so a prefix of words is a slice of text.
+    word_ends = list(accumulate(len(word) + 1 for word in text.split(" ")))
+    # Binary search for the longest prefix of words that still fits.
+    lo, hi = 0, len(word_ends)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if _measure(font_size, text[:word_ends[mid - 1] - 1]) <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    if not lo:
+        # Not even the first word fits, but the suffix alone may.
+        return suffix if max_width >= 0 else ""
+    return text[:word_ends[lo - 1] - 1] + suffix
+
+
+def build_index(data, key):
+    """
+    Indexes a list of dictionaries by the value of one of their keys, so that
+    repeated lookups against the same list don't have to scan it every time
+
+    :param data: list of dictionaries to index
+    :param key: key whose value the dictionaries are indexed by
+    :return: returns a mapping of each value to the positions holding it
+    """
+    index = defaultdict(list)
+    for position, d in enumerate(data):
+        index[d[key]].append(position)
+    return index
 
 
-def get_dict_pos(lst, key, value):
+def get_dict_pos(lst, key, value, index=None):
+    if index is not None:
+        positions = index.get(value)
+        return positions[0] if positions else None
     return next((index for (index, d) in enumerate(lst) if d[key] == value), None)
 
 
-def search_dict(search_term, data_key, data):
+def search_dict(search_term, data_key, data, index=None):
+    if index is not None:
+        # Test each distinct value once instead of every dictionary.
+        positions = sorted(
+            position
+            for value, value_positions in index.items()
+            if search_term in value
+            for position in value_positions
+        )
+        return [data[position] for position in positions]
     a = filter(lambda search_found: search_term in search_found[data_key], data)
     return list(a)
@@ -1,23 +1,28 @@
 from kivy import platform
 
 
+class _SilencerTask:
+    isSuccessful = staticmethod(lambda: True)
+
+
+_SILENCER_TASK = _SilencerTask()
+
+
 def silencer(func):
-    class task:
-        isSuccessful = lambda: True
+    if platform == "android":
+        return func
 
     def dont_crash_task(*args, **kwargs):
-        if platform == "android":
-            func(*args, **kwargs)
-        else:
-            kwargs.get("callback")(task)
+        kwargs["callback"](_SILENCER_TASK)
 
     return dont_crash_task
 
 
 def android_only(func):
+    if platform == "android":
+        return func
+
     def check_android(*args, **kwargs):
-        if platform != "android":
-            return
-        func(*args, **kwargs)
+        return
 
     return check_android
@@ -1,62 +1,146 @@
 from jnius import autoclass
 
 
-def serialize_map_to_dict(hash_map):
-    map_to_dict_data = {}
+_JMap = autoclass("java.util.Map")
+_JCollection = autoclass("java.util.Collection")
+_HashMap = autoclass("java.util.HashMap")
+_ArrayList = autoclass("java.util.ArrayList")
+_IdentityHashMap = autoclass("java.util.IdentityHashMap")
+
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+# The serializers below walk nested containers with an explicit stack
+# instead of recursing, so deeply nested data neither pays for a Python frame
+# per container nor hits the recursion limit. Every nested container is
+# created and attached to its parent as soon as it is seen, then filled when
+# it is popped from the stack. A container's exit is pushed beneath its
+# children, so the containers on the path to the current one are known and a
+# container holding itself raises ValueError instead of looping forever.
+
+
+# Container factory by the exact type of a value, filled the first time a
+# type is met. Repeated payloads of the same shape then resolve every value
+# with a single dict lookup instead of a chain of isinstance() checks.
+_python_factories = {}
+_java_factories = {dict: _HashMap, list: _ArrayList}
+
+
+def _new_python_container(value):
+    value_type = type(value)
+    try:
+        factory = _python_factories[value_type]
+    except KeyError:
+        if value is None or isinstance(value, _SCALAR_TYPES):
+            factory = None
+        elif isinstance(value, _JMap):
+            factory = dict
+        elif isinstance(value, _JCollection):
+            factory = list
+        else:
+            factory = None
+        _python_factories[value_type] = factory
+    return None if factory is None else factory()
 
-    for key, value in zip(hash_map, hash_map.values()):
-        if hasattr(value, "put"):
-            map_to_dict_data[key] = serialize_map_to_dict(value)
-        elif hasattr(value, "add"):
-            map_to_dict_data[key] = serialize_array_to_list(value)
+
+def _new_java_container(value):
+    value_type = type(value)
+    try:
+        factory = _java_factories[value_type]
+    except KeyError:
+        if isinstance(value, dict):
+            factory = _HashMap
+        elif isinstance(value, list):
+            factory = _ArrayList
+        else:
+            factory = None
+        _java_factories[value_type] = factory
+    return None if factory is None else factory()
+
+
+def _serialize_java(java_root, python_root):
+    stack = [(java_root, python_root)]
+    # Java proxies are new Python objects on every access, so the path is
+    # tracked by reference on the Java side.
+    on_path = _IdentityHashMap()
+
+    while stack:
+        java_data, python_data = stack.pop()
+        if python_data is None:
+            on_path.remove(java_data)
+            continue
+        if on_path.containsKey(java_data):
+            raise ValueError("Cannot serialize a container that contains itself")
+        on_path.put(java_data, None)
+        stack.append((java_data, None))
+        if isinstance(python_data, dict):
+            entries = java_data.entrySet().iterator()
+            while entries.hasNext():
+                entry = entries.next()
+                value = entry.getValue()
+                data = _new_python_container(value)
+                if data is None:
+                    python_data[entry.getKey()] = value
+                else:
+                    python_data[entry.getKey()] = data
+                    stack.append((value, data))
         else:
-            map_to_dict_data[key] = value
-    return map_to_dict_data
+            for value in java_data:
+                data = _new_python_container(value)
+                if data is None:
+                    python_data.append(value)
+                else:
+                    python_data.append(data)
+                    stack.append((value, data))
+    return python_root
+
+
+def _serialize_python(python_root, java_root):
+    stack = [(python_root, java_root)]
+    on_path = set()
+
+    while stack:
+        python_data, java_data = stack.pop()
+        if java_data is None:
+            on_path.remove(id(python_data))
+            continue
+        if id(python_data) in on_path:
+            raise ValueError("Cannot serialize a container that contains itself")
+        on_path.add(id(python_data))
+        stack.append((python_data, None))
+        if isinstance(python_data, dict):
+            for key, value in python_data.items():
+                data = _new_java_container(value)
+                if data is None:
+                    java_data.put(key, value)
+                else:
+                    java_data.put(key, data)
+                    stack.append((value, data))
+        else:
+            for value in python_data:
+                data = _new_java_container(value)
+                if data is None:
+                    java_data.add(value)
+                else:
+                    java_data.add(data)
+                    stack.append((value, data))
+    return java_root
+
+
+def serialize_map_to_dict(hash_map):
+    return _serialize_java(hash_map, {})
 
 
 def serialize_array_to_list(array):
-    array_to_list_data = []
-
-    for value in array:
-        if hasattr(value, "add"):
-            data = serialize_array_to_list(value)
-            array_to_list_data.append(data)
-        elif hasattr(value, "put"):
-            data = serialize_map_to_dict(value)
-            array_to_list_data.append(data)
-        else:
-            array_to_list_data.append(value)
-    return array_to_list_data
+    return _serialize_java(array, [])
 
 
 def serialize_dict_to_map(dictionary):
-    dict_to_map_data = autoclass("java.util.HashMap")()
-
-    for key, value in dictionary.items():
-        if isinstance(value, dict):
-            data = serialize_dict_to_map(value)
-            dict_to_map_data.put(key, data)
-        elif isinstance(value, list):
-            data = serialize_list_to_array(value)
-            dict_to_map_data.put(key, data)
-        else:
-            dict_to_map_data.put(key, value)
-    return dict_to_map_data
+    return _serialize_python(dictionary, _HashMap())
 
 
 def serialize_list_to_array(list_):
-    list_to_array_data = autoclass("java.util.ArrayList")()
-
-    for value in list_:
-        if isinstance(value, list):
-            data = serialize_list_to_array(value)
-            list_to_array_data.add(data)
-        elif isinstance(value, dict):
-            data = serialize_dict_to_map(value)
-            list_to_array_data.add(data)
-        else:
-            list_to_array_data.add(value)
-    return list_to_array_data
+    return _serialize_python(list_, _ArrayList())
 
 
 if __name__ == "__main__":
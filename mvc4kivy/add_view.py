@@ -39,7 +39,6 @@ __all__ = [
 ]
 
 import os
-import posixpath
 import re
 
 from kivy import Logger
@@ -47,6 +46,7 @@ from kivy import Logger
 from . import ArgumentParserWithHelp
 from .create_project import (
     check_camel_case_name_project,
+    get_module_name,
     create_common_responsive_module,
     create_controller,
     create_model,
@@ -63,14 +63,16 @@ screns_comment = """# The screen's dictionary contains the objects of the models
 # of the screens of the application.
 """
 
-instantiate_responsive_view = ""
+_IMPORTS_RE = re.compile(
+    r"from Model.*Model|from Controller.*Controller|from View.*View"
+)
+_CAMEL_RE = re.compile(r"[A-Z][^A-Z]*")
 
 
 def main():
     """The function of adding a new view to the project."""
 
     global screens_data
-    global instantiate_responsive_view
 
     parser = create_argument_parser()
     args = parser.parse_args()
@@ -85,14 +87,14 @@ def main():
     if not os.path.exists(path_to_project):
         parser.error(f"Project <{path_to_project}> does not exist...")
 
-    if name_view[-6:] != "Screen":
+    if not name_view.endswith("Screen"):
         parser.error(
             f"The name of the <{name_view}> screen should contain the word "
             f"'Screen' at the end.\n"
             "For example - '--name_screen MyFirstScreen ...'"
         )
 
-    if name_view in os.listdir(os.path.join(path_to_project, "View")):
+    if os.path.exists(os.path.join(path_to_project, "View", name_view)):
         parser.error(
             f"The <{name_view}> view also exists in the <{path_to_project}> project..."
         )
@@ -100,7 +102,7 @@ def main():
     # Create model.
     name_database = (
         "yes"
-        if "database.py" in os.listdir(os.path.join(path_to_project, "Model"))
+        if os.path.exists(os.path.join(path_to_project, "Model", "database.py"))
         else "no"
     )
     module_name = check_camel_case_name_project(name_view)
@@ -109,7 +111,7 @@ def main():
             "The name of the screen should be written in camel case style. "
             "\nFor example - 'MyFirstScreen'"
         )
-    module_name = "_".join([name.lower() for name in module_name])
+    module_name = get_module_name(name_view)
     create_model(name_view, module_name, name_database, path_to_project)
 
     # Create controller.
@@ -117,19 +119,24 @@ def main():
     #  a project uses a hot reload or not. Because the string
     #  'from kivymd.tools.hotreload.app import MDApp' in the project can just
     #  be commented out and the project does not actually use hot reload.
+    use_hotreload = "no"
     with open(os.path.join(path_to_project, "main.py")) as main_module:
-        if "from kivymd.tools.hotreload.app import MDApp" in main_module.read():
-            use_hotreload = "yes"
-        else:
-            use_hotreload = "no"
-        create_controller(
-            name_view, module_name, use_hotreload, path_to_project
-        )
+        for line in main_module:
+            if "from kivymd.tools.hotreload.app import MDApp" in line:
+                use_hotreload = "yes"
+                break
+    create_controller(name_view, module_name, use_hotreload, path_to_project)
     # Create View.
     if use_responsive == "no":
         create_view(name_view, module_name, [], path_to_project)
     else:
-        create_view(name_view, module_name, [name_view], path_to_project)
+        create_view(
+            name_view,
+            module_name,
+            [name_view],
+            path_to_project,
+            instantiate_responsive_view,
+        )
         create_common_responsive_module([name_view], path_to_project)
     # Create 'View.screens.py module'.
     update_screens_data(name_view, module_name, path_to_project)
@@ -145,33 +152,29 @@ def update_screens_data(
             os.path.join(path_to_project, "View", "screens.py")
     ) as screen_module:
         screen_module = screen_module.read()
-        imports = re.findall(
-            "from Model.*Model|from Controller.*Controller|from View.*View", screen_module
-        )
-        screens = ""
+        imports = _IMPORTS_RE.findall(screen_module)
+        screen_chunks = []
+        append_chunk = screen_chunks.append
         path_to_view = os.path.join(path_to_project, "View")
 
-        for name in os.listdir(path_to_view):
-            if os.path.isdir(os.path.join(path_to_view, name)):
-                res = re.findall(r"[A-Z][^A-Z]*", name)
-                # if res and len(res) == 2 and res[-1] == "Screen":
-                if res and len(res) > 1 and res[-1] == "Screen":
-                    snake_case = "_"
-                    screens += (
-                            "\n    '%s': {"
-                            "\n        'model': %s,"
-                            "\n        'controller': %s,"
-                            "\n        'view': %s,"
-                            "\n        'kv': %s"
-                            "\n    },\n"
-                            % (
-                                f"{' '.join(res).lower()}",
-                                f'{name}Model',
-                                f'{name}Controller',
-                                f'{name}View',
-                                f'"{posixpath.join("./View", name, f"{snake_case.join(res).lower()}.kv")}"',
-                            )
-                    )
+        with os.scandir(path_to_view) as entries:
+            names = [entry.name for entry in entries if entry.is_dir()]
+
+        for name in names:
+            res = _CAMEL_RE.findall(name)
+            # if res and len(res) == 2 and res[-1] == "Screen":
+            if res and len(res) > 1 and res[-1] == "Screen":
+                label = " ".join(res).lower()
+                kv = f"./View/{name}/{get_module_name(name)}.kv"
+                append_chunk(
+                    f"\n    '{label}': {{"
+                    f"\n        'model': {name}Model,"
+                    f"\n        'controller': {name}Controller,"
+                    f"\n        'view': {name}View,"
+                    f"\n        'kv': \"{kv}\""
+                    "\n    },\n"
+                )
+        screens = "".join(screen_chunks)
 
         imports.append(f"from Model.{module_name} import {name_view}Model")
         imports.append(
@@ -214,14 +214,17 @@ __all__ = [
     "main",
 ]
 
-import contextlib
 import os
-import posixpath
 import re
+import shlex
 import shutil
+import subprocess
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from pathlib import Path
+from string import Template
 from typing import Union
 
-from kivy import Logger, platform
 from . import ArgumentParserWithHelp
 
 temp_basemodel = '''# The model implements the observer pattern. This means that the class must
@@ -291,12 +294,21 @@ class {name_screen}Model(BaseScreenModel):
     :class:`~View.{module_name}.{name_screen}.{name_screen}View` class.
     """'''
 
-temp_screens_imports = """# The screens dictionary contains the objects of the models and controllers
+temp_screens_comment = """# The screens dictionary contains the objects of the models and controllers
 # of the screens of the application.
 
 
 """
 
+temp_screens_entry = """
+    "{label}": {{
+        "model": {name_screen}Model,
+        "controller": {name_screen}Controller,
+        "view": {name_screen}View,
+        "kv": "{kv}"
+    }},
+"""
+
 temp_code_responsive_view = '''from kivymd.uix.responsivelayout import MDResponsiveLayout
 
 from View.{name_screen}.components import (
@@ -453,16 +465,18 @@ import os
 
 from kivy import Config
 
-from PIL import ImageGrab
+from screeninfo import get_monitors
 
-# TODO: You may know an easier way to get the size of a computer display.
-resolution = ImageGrab.grab().size
+# Only the monitor geometry is read, no screenshot of the display is taken.
+monitors = get_monitors()
+monitor = next((m for m in monitors if m.is_primary), monitors[0])
+resolution = (monitor.width, monitor.height)
 
 # Change the values of the application window size as you need.
 Config.set("graphics", "height", resolution[1])
 Config.set("graphics", "width", "400")
 
-from kivy.core.window import Window{}
+from kivy.core.window import Window${string_property_import}
 
 # Place the application window on the right side of the computer screen.
 Window.top = 0
@@ -470,10 +484,10 @@ Window.left = resolution[0] - Window.width
 
 from kivymd.tools.hotreload.app import MDApp
 from kivymd.uix.screenmanager import MDScreenManager
-{}{}
+${database_import}${translation_import}
 
-class {}(MDApp):
-    KV_DIRS = [os.path.join(os.getcwd(), "View")]{}
+class ${project_name}(MDApp):
+    KV_DIRS = [os.path.join(os.getcwd(), "View")]${lang_property}
 
     def build_app(self) -> MDScreenManager:
         """
@@ -483,13 +497,13 @@ class {}(MDApp):
 
         import View.screens
 
-        self.manager_screens = MDScreenManager(){}{}
+        self.manager_screens = MDScreenManager()${database_init}${translation_init}
         Window.bind(on_key_down=self.on_keyboard_down)
         importlib.reload(View.screens)
         screens = View.screens.screens
 
         for i, name_screen in enumerate(screens.keys()):
-            model = screens[name_screen]["model"]({})
+            model = screens[name_screen]["model"](${database_arg})
             controller = screens[name_screen]["controller"](model)
             view = controller.get_view()
             view.name = name_screen
@@ -506,10 +520,10 @@ class {}(MDApp):
         """
 
         if "meta" in modifiers or "ctrl" in modifiers and text == "r":
-            self.rebuild(){}{}
+            self.rebuild()
+${on_lang}${switch_lang}
 
-
-{}().run()
+${project_name}().run()
 
 # After you finish the project, remove the above code and uncomment the below
 # code to test the application normally without hot reloading.
@@ -540,7 +554,7 @@ You can read more about this template at the links below:
 https://github.com/HeaTTheatR/LoginAppMVC
 https://en.wikipedia.org/wiki/Model–view–controller
 """
-{}
+${string_property_import}
 from kivymd.app import MDApp
 from kivymd.uix.screenmanager import MDScreenManager
 from kivymd.uix.transition import MDSharedAxisTransition
@@ -552,13 +566,12 @@ from kivy.metrics import dp
 from kivymd.utils.set_bars_colors import set_bars_colors
 from kivy.core.window import Window
 
-from View.screens import screens{}
-{}
+from View.screens import screens
+${translation_import}${database_import}
 
-class {}(MDApp):{}
+class ${project_name}(MDApp):${lang_property}
     def __init__(self, **kwargs):
-        super().__init__(**kwargs){}
-        {}
+        super().__init__(**kwargs)${translation_init}${database_init}
         self.dialog = None
         self.theme_cls.bind(
             theme_style=self.update_colors,
@@ -610,7 +623,7 @@ class {}(MDApp):{}
 
     def load_screen(self, name_screen, switch, first):
         Builder.load_file(screens[name_screen]["kv"])
-        model = screens[name_screen]["model"]({})
+        model = screens[name_screen]["model"](${database_arg})
         controller = screens[name_screen]["controller"](self, model)
         view = screens[name_screen]["view"](self, model=model, controller=controller)
         controller.set_view(view)
@@ -619,9 +632,10 @@ class {}(MDApp):{}
             self.root.current = name_screen
         if not first:
             self.dialog.dismiss()
-{}{}
+${on_lang}${switch_lang}
+
 if __name__ == "__main__":
-    {}().run()
+    ${project_name}().run()
 '''
 
 temp_makefile = """# FILE TO FIND AND CREATE LOCALIZATION FILES FOR YOUR APPLICATION. \\
@@ -669,82 +683,102 @@ kivymd==1.0.0
 
 available_patterns = ["MVC"]
 available_databases = ["firebase", "restdb"]
+# Resolved once at import, so later changes of the working directory do not
+# affect where the patterns are looked up.
+path_to_patterns = os.path.dirname(os.path.abspath(__file__))
+
+_CAMEL_RE = re.compile(r"[A-Z][^A-Z]*")
+
 
-path_to_project = ""
-project_name = ""
-use_localization = ""
-name_database = ""
-use_hotreload = ""
-temp_makefile_files = ""
-temp_screens_data = ""
-kivy_version = ""
-python_version = ""
-use_venv = ""
-instantiate_responsive_view = ""
+@dataclass(frozen=True)
+class ProjectConfig:
+    """Options of the project being created, read once from the command line."""
+
+    path_to_project: str
+    project_name: str
+    python_version: str
+    kivy_version: str
+    name_database: str
+    use_hotreload: str
+    use_localization: str
+    use_venv: str
+    instantiate_responsive_view: str
+
+
+@dataclass
+class ProjectScreens:
+    """
+    Entries collected from every screen for the modules that list all the
+    screens of the project: `View/screens.py` and the `Makefile`.
+    """
+
+    screens_imports: list = field(default_factory=list)
+    screens_data: list = field(default_factory=list)
+    makefile_files: list = field(default_factory=list)
 
 
 def main():
     """Project creation function."""
 
-    global project_name
-    global use_localization
-    global name_database
-    global use_hotreload
-    global temp_makefile_files
-    global temp_screens_data
-    global path_to_project
-    global kivy_version
-    global python_version
-    global use_venv
-    global instantiate_responsive_view
-
     parser = create_argument_parser()
     args = parser.parse_args()
 
     pattern_name = args.pattern
-    project_directory = args.directory
-    project_name = "".join(args.name.split(" "))
-    kivy_version = args.kivy_version
-    python_version = args.python_version
-    if "3" not in python_version:
+    project_name = args.name.replace(" ", "")
+    if "3" not in args.python_version:
         parser.error("Python must be at least version 3")
     name_screen = args.name_screen
-    path_to_project = os.path.join(project_directory, project_name)
-    name_database = args.name_database
-    use_venv = args.use_venv
-    if name_database != "no" and name_database not in available_databases:
+    if (
+            args.name_database != "no"
+            and args.name_database not in available_databases
+    ):
         parser.error(
             f"The database name must be one of the {available_databases} list"
         )
-    use_hotreload = args.use_hotreload
-    use_localization = args.use_localization
     use_responsive = args.use_responsive
-    instantiate_responsive_view = args.instantiate_responsive_view
+    config = ProjectConfig(
+        path_to_project=os.path.join(args.directory, project_name),
+        project_name=project_name,
+        python_version=args.python_version,
+        kivy_version=args.kivy_version,
+        name_database=args.name_database,
+        use_hotreload=args.use_hotreload,
+        use_localization=args.use_localization,
+        use_venv=args.use_venv,
+        instantiate_responsive_view=args.instantiate_responsive_view,
+    )
+    path_to_project = config.path_to_project
 
     # Check arguments.
     for name in name_screen:
-        if name[-6:] != "Screen":
+        if not name.endswith("Screen"):
             parser.error(
                 f"The name of the {name} screen should contain the word "
                 f"'Screen' at the end.\n"
                 "For example - '--name_screen MyFirstScreen ...'"
             )
-    if not os.path.exists(
-            os.path.join(os.path.dirname(__file__), pattern_name)
-    ):
+    path_to_pattern = os.path.join(path_to_patterns, pattern_name)
+    if not os.path.exists(path_to_pattern):
         parser.error(
             f"There is no {pattern_name} pattern.\n"
             f"Only {available_patterns} template is available."
         )
 
+    # Kivy is only imported once the arguments are valid, so `--help` and
+    # argument errors do not pay for loading the framework.
+    from kivy import Logger
+
     # Call the functions of creating a project.
     if not os.path.exists(path_to_project):
         shutil.copytree(
-            os.path.join(os.path.dirname(__file__), pattern_name),
+            path_to_pattern,
             path_to_project,
+            ignore=partial(ignore_unused_files, config, path_to_pattern),
         )
-        create_main()
+        main_fragments = create_main_fragments(config)
+        create_main(config, main_fragments)
 
+        screens = ProjectScreens()
         for name in name_screen:
             module_name = check_camel_case_name_project(name)
             if not module_name:
@@ -752,179 +786,181 @@ def main():
                     "The name of the screen should be written in camel case style. "
                     "\nFor example - 'MyFirstScreen'"
                 )
-            module_name = "_".join([name.lower() for name in module_name])
-
-            # Create models module.
-            create_model(name, module_name, name_database, path_to_project)
-            # Create controllers module.
-            create_controller(name, module_name, use_hotreload, path_to_project)
-            # Create screens data.
-            create_screens_data(name, module_name)
-            if use_localization == "yes":
-                # Create makefile data.
-                create_makefile_data(name, module_name)
-            # Create views.
-            create_view(name, module_name, use_responsive, path_to_project)
+            create_screen_files(
+                name, get_module_name(name), use_responsive, config, screens
+            )
 
         # Create module `NameProject/View/NameScreen/components/common/__init__.py`.
         create_common_responsive_module(use_responsive, path_to_project)
         # Create module `NameProject/View/screens.py`.
-        create_module_screens()
+        create_module_screens(path_to_project, screens)
         # Create module `NameProject/Model/base_model.py`.
-        create_basemodel()
+        create_basemodel(path_to_project)
         # Create module `NameProject/View/base_screen.py`.
-        create_module_basescreen()
+        create_module_basescreen(path_to_project)
         # Create package `NameProject/Utility`.
-        create_package_utility()
+        create_package_utility(path_to_project)
         # Create file `NameProject/Makefile`.
-        if use_localization == "yes":
+        if config.use_localization == "yes":
             # Create makefile data.
-            create_makefile()
+            create_makefile(path_to_project, screens)
 
-        create_requirements()
-        os.makedirs(os.path.join(path_to_project, "assets", "images"))
-        os.mkdir(os.path.join(path_to_project, "assets", "fonts"))
+        create_requirements(config)
+        path_to_assets = os.path.join(path_to_project, "assets")
+        for name_assets in ("images", "fonts"):
+            os.makedirs(os.path.join(path_to_assets, name_assets), exist_ok=True)
 
-        if name_database != "no":
-            check_databases()
+        if config.name_database != "no":
+            check_databases(config)
 
-        if use_hotreload == "yes":
-            create_main_with_hotreload()
-            with open(
-                    os.path.join(path_to_project, "requirements.txt"),
-                    "a",
-                    encoding="utf-8",
-            ) as requirements:
-                requirements.write("watchdog")
+        if config.use_hotreload == "yes":
+            create_main_with_hotreload(config, main_fragments)
 
-        if use_localization == "yes":
+        if config.use_localization == "yes":
             Logger.info("KivyMD: Create localization files...")
-            os.chdir(path_to_project)
-            os.system("make po")
-            os.system("make mo")
-        else:
-            os.remove(os.path.join(path_to_project, "messages.pot"))
-            os.remove(os.path.join(path_to_project, "libs", "translation.py"))
-            shutil.rmtree(os.path.join(path_to_project, "data"))
+            if shutil.which("make"):
+                # -k still builds `mo` if `po` fails, like two separate calls.
+                subprocess.run(
+                    ["make", "-k", "-C", path_to_project, "po", "mo"],
+                    check=False,
+                )
+            else:
+                Logger.warning(
+                    "KivyMD: 'make' not found, localization files were not "
+                    "created. Run 'make po mo' in the project directory later"
+                )
 
         Logger.info(f"KivyMD: Project '{path_to_project}' created")
         Logger.info(
             f"KivyMD: Create a virtual environment for '{path_to_project}' project..."
         )
-        if use_venv == "yes":
-            create_virtual_environment()
-            Logger.info(
-                f"KivyMD: Install requirements for '{path_to_project}' project..."
-            )
-            install_requirements()
-        with contextlib.suppress(FileNotFoundError):
-            os.remove(os.path.join(path_to_project, "__init__.py"))
-        if name_database == "no":
-            os.remove(
-                os.path.join(path_to_project, "Model", "database_firebase.py")
-            )
-            os.remove(
-                os.path.join(path_to_project, "Model", "database_restdb.py")
-            )
+        if config.use_venv == "yes":
+            if create_virtual_environment(config):
+                Logger.info(
+                    f"KivyMD: Install requirements for '{path_to_project}' project..."
+                )
+                install_requirements(config)
+            else:
+                Logger.warning(
+                    "KivyMD: The virtual environment was not created, "
+                    "requirements were not installed"
+                )
+        Path(path_to_project, "__init__.py").unlink(missing_ok=True)
     else:
         parser.error(f"The {path_to_project} project already exists")
 
 
-def create_main_with_hotreload() -> None:
-    with open(
-            os.path.join(path_to_project, "main.py"), encoding="utf-8"
-    ) as main_file:
-        main_code = "".join(f"# {string}" for string in main_file.readlines())
-    with open(
-            os.path.join(path_to_project, "main.py"), "w", encoding="utf-8"
-    ) as main_file:
-        main_file.write(f"{temp_hot_reload_main}\n{main_code}")
-
-    with open(
-            os.path.join(path_to_project, "main.py"), encoding="utf-8"
-    ) as main_file:
-        main_code = main_file.read()
-        main_code = main_code.format(
-            "\nfrom kivy.properties import StringProperty\n"
-            if use_localization == "yes"
-            else "",
-            "\nfrom Model.database import DataBase"
-            if name_database != "no"
-            else "",
-            "\nfrom libs.translation import Translation\n"
-            if use_localization == "yes"
-            else "",
-            project_name,
-            '\n    lang = StringProperty("en")\n'
-            if use_localization == "yes"
-            else "",
-            "\n        self.base = DataBase()\n"
-            if name_database != "no"
-            else "",
-            "\n        self.translation = Translation(\n"
-            '            self.lang, "%s", os.path.join(self.directory, "data", "locales")'
-            "\n        )" % project_name
-            if use_localization == "yes"
-            else "",
-            "self.database" if name_database != "no" else "",
-            "\n\n    def on_lang(self, instance_app, lang_value: str) -> None:\n"
-            "        self.translation.switch_lang(lang_value)\n"
-            if use_localization == "yes"
-            else "",
-            "\n    def switch_lang(self) -> None:\n"
-            '        """Switch lang."""\n\n'
-            '        self.lang = "ru" if self.lang == "en" else "en"'
-            if use_localization == "yes"
-            else "",
-            project_name,
+def write_file(path: str, data: str) -> None:
+    """Writes the whole text of a generated file with a single `write`."""
+
+    # The text is encoded once and written in binary mode, so no text
+    # wrapper or incremental encoder is set up per file. Line endings are
+    # written as `\n` on every platform.
+    with open(path, "wb") as file:
+        file.write(data.encode("utf-8"))
+
+
+def touch_file(path: str) -> None:
+    """Creates an empty file, such as the `__init__.py` of a package."""
+
+    # No data is written, so no Python file object is needed either.
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
+
+
+def create_main_fragments(config: ProjectConfig) -> dict:
+    """
+    Returns the optional code fragments shared by the `main.py` templates,
+    empty for the options that are not enabled.
+    """
+
+    fragments = {
+        "project_name": config.project_name,
+        "string_property_import": "",
+        "translation_import": "",
+        "database_import": "",
+        "lang_property": "",
+        "translation_init": "",
+        "database_init": "",
+        "database_arg": "",
+        "on_lang": "",
+        "switch_lang": "",
+    }
+    if config.use_localization == "yes":
+        fragments.update(
+            string_property_import="\nfrom kivy.properties import StringProperty\n",
+            translation_import="from libs.translation import Translation\n",
+            lang_property='\n    lang = StringProperty("en")\n',
+            translation_init=(
+                "\n        self.translation = Translation(\n"
+                '            self.lang, "%s", os.path.join(self.directory, "data", "locales")'
+                "\n        )" % config.project_name
+            ),
+            on_lang=(
+                "\n    def on_lang(self, instance_app, lang_value: str) -> None:\n"
+                "        self.translation.switch_lang(lang_value)\n"
+            ),
+            switch_lang=(
+                "\n    def switch_lang(self) -> None:\n"
+                '        """Switch lang."""\n\n'
+                '        self.lang = "ru" if self.lang == "en" else "en"\n'
+            ),
+        )
+    if config.name_database != "no":
+        fragments.update(
+            database_import="from Model.database import DataBase\n",
+            database_init="\n        self.database = DataBase()\n",
+            database_arg="self.database",
         )
-        with open(
-                os.path.join(path_to_project, "main.py"), "w", encoding="utf-8"
-        ) as main_module:
-            main_module.write(main_code)
-
-
-def create_main() -> None:
-    main_code = temp_main.format(
-        "\nfrom kivy.properties import StringProperty\n"
-        if use_localization == "yes"
-        else "",
-        "\nfrom libs.translation import Translation"
-        if use_localization == "yes"
-        else "",
-        "from Model.database import DataBase\n"
-        if name_database != "no"
-        else "",
-        project_name,
-        '\n    lang = StringProperty("en")\n'
-        if use_localization == "yes"
-        else "",
-        "\n        self.translation = Translation(\n"
-        '            self.lang, "%s", os.path.join(self.directory, "data", "locales")'
-        "\n        )" % project_name
-        if use_localization == "yes"
-        else "",
-        "self.database = DataBase()\n" if name_database != "no" else "",
-        "self.database" if name_database != "no" else "",
-        "\n    def on_lang(self, instance_app, lang_value: str) -> None:\n"
-        "        self.translation.switch_lang(lang_value)\n"
-        if use_localization == "yes"
-        else "",
-        "\n    def switch_lang(self) -> None:\n"
-        '        """Switch lang."""\n\n'
-        '        self.lang = "ru" if self.lang == "en" else "en"\n'
-        if use_localization == "yes"
-        else "\n",
-        project_name,
+    return fragments
+
+
+def create_main_with_hotreload(config: ProjectConfig, fragments: dict) -> None:
+    path_to_main = os.path.join(config.path_to_project, "main.py")
+    with open(path_to_main, encoding="utf-8") as main_file:
+        main_code = "".join(f"# {line}" for line in main_file)
+
+    hot_reload_code = Template(temp_hot_reload_main).substitute(fragments)
+    write_file(path_to_main, f"{hot_reload_code}\n{main_code}")
+
+
+def create_main(config: ProjectConfig, fragments: dict) -> None:
+    main_code = Template(temp_main).substitute(fragments)
+    write_file(os.path.join(config.path_to_project, "main.py"), main_code)
+    touch_file(os.path.join(config.path_to_project, "imports.kv"))
+
+
+def create_screen_files(
+        name_screen: str,
+        module_name: str,
+        use_responsive: list,
+        config: ProjectConfig,
+        screens: ProjectScreens,
+) -> None:
+    """
+    Creates the model, controller and view of one screen and records its
+    entries for `View/screens.py` and the `Makefile`.
+    """
+
+    path_to_project = config.path_to_project
+    # Create models module.
+    create_model(name_screen, module_name, config.name_database, path_to_project)
+    # Create controllers module.
+    create_controller(
+        name_screen, module_name, config.use_hotreload, path_to_project
+    )
+    # Create screens data.
+    create_screens_data(name_screen, module_name, screens)
+    if config.use_localization == "yes":
+        # Create makefile data.
+        create_makefile_data(name_screen, module_name, screens)
+    # Create views.
+    create_view(
+        name_screen,
+        module_name,
+        use_responsive,
+        path_to_project,
+        config.instantiate_responsive_view,
     )
-    with open(
-            os.path.join(path_to_project, "main.py"), "w", encoding="utf-8"
-    ) as main_module:
-        main_module.write(main_code)
-    with open(
-            os.path.join(path_to_project, "imports.kv"), "w", encoding="utf-8"
-    ) as fp:
-        pass
 
 
 def create_model(
@@ -934,34 +970,28 @@ def create_model(
         code_model = temp_database_model.format(
             name_screen=name_screen,
             module_name=module_name,
-            notify_name_screen=f'"{" ".join(module_name.split("_"))}"',
+            notify_name_screen=f'"{module_name.replace("_", " ")}"',
         )
     else:
         code_model = temp_without_database_model.format(
             module_name=module_name, name_screen=name_screen
         )
 
-    model_module = os.path.join(path_to_project, "Model", module_name)
-    with open(f"{model_module}.py", "w", encoding="utf-8") as module:
-        module.write(code_model)
+    write_file(
+        os.path.join(path_to_project, "Model", f"{module_name}.py"), code_model
+    )
 
 
-def create_basemodel() -> None:
-    with open(
-            os.path.join(path_to_project, "Model", "base_model.py"),
-            "w",
-            encoding="utf-8",
-    ) as module_basemodel:
-        module_basemodel.write(temp_basemodel)
+def create_basemodel(path_to_project: str) -> None:
+    write_file(
+        os.path.join(path_to_project, "Model", "base_model.py"), temp_basemodel
+    )
 
 
-def create_module_basescreen() -> None:
-    with open(
-            os.path.join(path_to_project, "View", "base_screen.py"),
-            "w",
-            encoding="utf-8",
-    ) as base_screen:
-        base_screen.write(temp_base_screen)
+def create_module_basescreen(path_to_project: str) -> None:
+    write_file(
+        os.path.join(path_to_project, "View", "base_screen.py"), temp_base_screen
+    )
 
 
 def create_controller(
@@ -978,64 +1008,54 @@ def create_controller(
     path_to_base_controller = os.path.join(path_to_controller, "base_controller.py")
     if not os.path.exists(path_to_controller):
         os.mkdir(path_to_controller)
-        with open(path_to_base_controller, "w", encoding="utf-8") as base:
-            base.write(temp_base_controller)
-    controller_module = os.path.join(path_to_project, "Controller", module_name)
-    with open(f"{controller_module}.py", "w", encoding="utf-8") as module:
-        module.write(code_controller)
-
+        write_file(path_to_base_controller, temp_base_controller)
+    write_file(
+        os.path.join(path_to_controller, f"{module_name}.py"), code_controller
+    )
 
-def create_makefile() -> None:
-    makefile = temp_makefile.format(temp_makefile_files[:-2])
-    with open(
-            os.path.join(path_to_project, "Makefile"), "w", encoding="utf-8"
-    ) as make_file:
-        make_file.write(makefile)
 
+def create_makefile(path_to_project: str, screens: ProjectScreens) -> None:
+    makefile = temp_makefile.format("".join(screens.makefile_files)[:-2])
+    write_file(os.path.join(path_to_project, "Makefile"), makefile)
 
-def create_makefile_data(name_screen: str, module_name: str) -> None:
-    global temp_makefile_files
 
-    temp_makefile_files += (
+def create_makefile_data(
+        name_screen: str, module_name: str, screens: ProjectScreens
+) -> None:
+    screens.makefile_files.append(
         f"                View/{name_screen}/{module_name}.py \\\n"
-    )
-    temp_makefile_files += (
         f"                View/{name_screen}/{module_name}.kv \\\n"
     )
 
 
-def create_screens_data(name_screen: str, module_name: str) -> None:
-    global temp_screens_imports
-    global temp_screens_data
-
-    temp_screens_imports += (
+def create_screens_data(
+        name_screen: str, module_name: str, screens: ProjectScreens
+) -> None:
+    screens.screens_imports.append(
         f"from Model.{module_name} import {name_screen}Model\n"
         f"from Controller.{module_name} import {name_screen}Controller\n"
         f"from View.{name_screen}.{module_name} import {name_screen}View\n"
     )
-    temp_screens_data += (
-            '\n    %s: {'
-            '\n        "model": %s,'
-            '\n        "controller": %s,'
-            '\n        "view": %s,'
-            '\n        "kv": %s'
-            '\n    },\n'
-            % (
-                f'"{" ".join(module_name.split("_"))}"',
-                f"{name_screen}Model",
-                f"{name_screen}Controller",
-                f"{name_screen}View",
-                f"\"{posixpath.join('./View', name_screen, f'{module_name}.kv')}\"",
-            )
+    screens.screens_data.append(
+        temp_screens_entry.format(
+            label=module_name.replace("_", " "),
+            name_screen=name_screen,
+            kv=f"./View/{name_screen}/{module_name}.kv",
+        )
     )
 
 
-def create_module_screens() -> None:
+def create_module_screens(path_to_project: str, screens: ProjectScreens) -> None:
     path_to_module_screens = os.path.join(path_to_project, "View", "screens.py")
-    with open(path_to_module_screens, "w", encoding="utf-8") as module_screens:
-        module_screens.write(
-            "%s\nscreens = {%s}\n" % (temp_screens_imports, temp_screens_data)
-        )
+    write_file(
+        path_to_module_screens,
+        "%s%s\nscreens = {%s}\n"
+        % (
+            temp_screens_comment,
+            "".join(screens.screens_imports),
+            "".join(screens.screens_data),
+        ),
+    )
 
 
 def create_common_responsive_module(
@@ -1046,182 +1066,251 @@ def create_common_responsive_module(
             path_to_project, "View", name_screen, "components", "common"
         )
         os.makedirs(path_to_init_common)
-        with open(
-                os.path.join(path_to_init_common, "__init__.py"),
-                "w",
-                encoding="utf-8",
-        ) as init_common_components:
-            init_common_components.write(
-                "# This directory is for common responsive design components\n"
-            )
+        write_file(
+            os.path.join(path_to_init_common, "__init__.py"),
+            "# This directory is for common responsive design components\n",
+        )
 
 
 def create_view(
         name_screen: str,
         module_name: str,
         use_responsive: list,
-        path_to_project: str
+        path_to_project: str,
+        instantiate_responsive_view: str = "yes",
 ) -> None:
     path_to_view = os.path.join(path_to_project, "View", name_screen)
     path_to_components = os.path.join(path_to_view, "components")
     view_module = os.path.join(path_to_view, module_name)
-    os.makedirs(path_to_view)
-    os.makedirs(path_to_components)
-
-    with open(
-            os.path.join(path_to_view, "__init__.py"), "w", encoding="utf-8"
-    ) as init_module:
-        init_module.write("")
-    with open(f"{view_module}.py", "w", encoding="utf-8") as view_file:
-        view_file.write(
-            temp_code_view.format(name_screen=name_screen)
-            if name_screen not in use_responsive
-            else temp_code_responsive_view.format(
-                name_screen=name_screen,
-                parenthesis="()" if instantiate_responsive_view == "yes" else ""
-            )
-        )
+    # The directories and files of the view are collected first and then
+    # created back to back.
+    dirs = [path_to_components]
+    packages = [path_to_view]
+    files = []
 
     if name_screen in use_responsive:
-        for name_platform in ["Desktop", "Mobile", "Tablet"]:
-            path_to_init_components = os.path.join(
-                path_to_project,
-                "View",
-                name_screen,
-                "components",
-                "__init__.py",
-            )
-            path_to_platforms = os.path.join(
-                path_to_project, "View", name_screen, "components", "platforms"
+        files.append(
+            (
+                f"{view_module}.py",
+                temp_code_responsive_view.format(
+                    name_screen=name_screen,
+                    parenthesis="()" if instantiate_responsive_view == "yes" else "",
+                ),
             )
+        )
+        path_to_platforms = os.path.join(path_to_components, "platforms")
+        packages.append(path_to_platforms)
+        for name_platform in ["Desktop", "Mobile", "Tablet"]:
             path_to_platform = os.path.join(path_to_platforms, name_platform)
             path_to_platform_components = os.path.join(
                 path_to_platform, "components"
             )
-            os.makedirs(path_to_platform_components)
-            shutil.copy(
-                os.path.join(path_to_view, "__init__.py"),
-                path_to_platform_components,
-            )
-            shutil.copy(
-                os.path.join(path_to_view, "__init__.py"), path_to_platforms
-            )
-
+            dirs.append(path_to_platform_components)
+            packages.append(path_to_platform_components)
             name_platform_module = name_platform.lower()
-            with open(
-                    os.path.join(path_to_platform, f"{name_platform_module}.kv"),
-                    "w",
-                    encoding="utf-8",
-            ) as platform_rule:
-                platform_rule.write(f"<{name_screen}{name_platform}View>\n")
-            with open(
-                    os.path.join(path_to_platform, f"{name_platform_module}.py"),
-                    "w",
-                    encoding="utf-8",
-            ) as platform_baseclass:
-                platform_baseclass.write(
-                    temp_responsive_platform_baseclass.format(f"{name_screen}{name_platform}")
+            files.extend(
+                (
+                    (
+                        os.path.join(path_to_platform, f"{name_platform_module}.kv"),
+                        f"<{name_screen}{name_platform}View>\n",
+                    ),
+                    (
+                        os.path.join(path_to_platform, f"{name_platform_module}.py"),
+                        temp_responsive_platform_baseclass.format(
+                            f"{name_screen}{name_platform}"
+                        ),
+                    ),
                 )
+            )
+        files.append(
+            (
+                os.path.join(path_to_components, "__init__.py"),
+                temp_responsive_component_imports.format(name_screen=name_screen),
+            )
+        )
+    else:
+        files.append(
+            (f"{view_module}.py", temp_code_view.format(name_screen=name_screen))
+        )
+        packages.append(path_to_components)
 
-        with open(
-                path_to_init_components, "w", encoding="utf-8"
-        ) as init_components:
-            init_components.write(temp_responsive_component_imports.format(name_screen=name_screen))
-
-    with open(f"{view_module}.kv", "w", encoding="utf-8") as view_file:
-        view_file.write(f"<{name_screen}View>\n    name: '{module_name.replace('_', ' ')}'")
-
-    if name_screen not in use_responsive:
-        shutil.copy(
-            os.path.join(path_to_view, "__init__.py"), path_to_components
+    files.append(
+        (
+            f"{view_module}.kv",
+            f"<{name_screen}View>\n    name: '{module_name.replace('_', ' ')}'",
         )
+    )
+
+    for path in dirs:
+        os.makedirs(path)
+    for path in packages:
+        touch_file(os.path.join(path, "__init__.py"))
+    for path, data in files:
+        write_file(path, data)
 
 
-def create_package_utility() -> None:
+def create_package_utility(path_to_project: str) -> None:
     path_to_utility = os.path.join(path_to_project, "Utility")
     os.mkdir(path_to_utility)
 
-    with open(
-            os.path.join(path_to_utility, "__init__.py"), "w", encoding="utf-8"
-    ) as init_module:
-        init_module.write("")
-    with open(
-            os.path.join(path_to_utility, "observer.py"), "w", encoding="utf-8"
-    ) as observer:
-        observer.write(temp_utility)
-
-
-def create_requirements() -> None:
-    with open(
-            os.path.join(path_to_project, "requirements.txt"), "w", encoding="utf-8"
-    ) as requirements:
-        requirements.write(
-            firebase_requirements
-            if name_database == "firebase"
-            else without_firebase_requirements
-        )
+    touch_file(os.path.join(path_to_utility, "__init__.py"))
+    write_file(os.path.join(path_to_utility, "observer.py"), temp_utility)
 
 
-def create_virtual_environment() -> None:
-    os.system(f"{python_version} -m pip install virtualenv")
-    os.system(
-        f"virtualenv -p {python_version} {os.path.join(path_to_project, 'venv')}"
+def create_requirements(config: ProjectConfig) -> None:
+    requirements = (
+        firebase_requirements
+        if config.name_database == "firebase"
+        else without_firebase_requirements
+    )
+    if config.use_hotreload == "yes":
+        requirements += "watchdog\nscreeninfo"
+    write_file(
+        os.path.join(config.path_to_project, "requirements.txt"), requirements
     )
 
 
-def install_requirements() -> None:
-    python = os.path.join(path_to_project, "venv", "bin", "python3")
+def create_virtual_environment(config: ProjectConfig) -> bool:
+    """Returns whether the virtual environment was created."""
+
+    from kivy import Logger
+
+    # The requested interpreter creates the environment itself, so neither
+    # virtualenv has to be installed first nor a shell has to be spawned.
+    # A value that is not a single command, such as 'py -3.9', is split
+    # into its arguments the way the shell used to do it.
+    python_version = config.python_version
+    if shutil.which(python_version):
+        command = [python_version]
+    else:
+        command = shlex.split(python_version)
+    try:
+        result = subprocess.run(
+            [
+                *command,
+                "-m",
+                "venv",
+                os.path.join(config.path_to_project, "venv"),
+            ],
+            check=False,
+        )
+    except OSError as error:
+        Logger.error(f"KivyMD: Could not run '{python_version}': {error}")
+        return False
+    return result.returncode == 0
+
+
+def install_requirements(config: ProjectConfig) -> None:
+    from kivy import Logger, platform
+
+    kivy_version = config.kivy_version
+    if platform == "win":
+        python = os.path.join(
+            config.path_to_project, "venv", "Scripts", "python.exe"
+        )
+    else:
+        python = os.path.join(config.path_to_project, "venv", "bin", "python3")
+    if not os.path.exists(python):
+        Logger.warning(
+            f"KivyMD: '{python}' not found, requirements were not installed"
+        )
+        return
     if kivy_version == "master":
         if platform == "macosx":
-            os.system(
-                f"{python} -m pip install 'kivy[base] @ https://github.com/kivy/kivy/archive/master.zip'"
-            )
+            kivy = "kivy[base] @ https://github.com/kivy/kivy/archive/master.zip"
         else:
-            os.system(
-                f"{python} -m pip install https://github.com/kivy/kivy/archive/master.zip"
-            )
+            kivy = "https://github.com/kivy/kivy/archive/master.zip"
     elif kivy_version == "stable":
-        os.system(f"{python} -m pip install kivy")
+        kivy = "kivy"
     else:
-        os.system(f"{python} -m pip install kivy=={kivy_version}")
-    os.system(
-        f"{python} -m pip install https://github.com/kivymd/KivyMD/archive/master.zip"
-    )
-    os.system(f"{python} -m pip install watchdog")
-    if name_database == "firebase":
-        os.system(
-            f"{python} -m pip install "
-            f"multitasking "
-            f"firebase "
-            f"firebase-admin "
-            f"python_jwt "
-            f"gcloud "
-            f"sseclient "
-            f"pycryptodome==3.4.3 "
-            f"requests_toolbelt "
-            f"watchdog "
+        kivy = f"kivy=={kivy_version}"
+    packages = [
+        kivy,
+        "https://github.com/kivymd/KivyMD/archive/master.zip",
+        "watchdog",
+    ]
+    if config.use_hotreload == "yes":
+        packages.append("screeninfo")
+    if config.name_database == "firebase":
+        packages.extend(
+            (
+                "multitasking",
+                "firebase",
+                "firebase-admin",
+                "python_jwt",
+                "gcloud",
+                "sseclient",
+                "pycryptodome==3.4.3",
+                "requests_toolbelt",
+            )
         )
-    os.system(
-        f"{os.path.join(path_to_project, 'venv', 'bin', 'python3')} -m pip list"
-    )
+    # A single pip run resolves all the packages together instead of
+    # starting pip and its resolver once per group.
+    try:
+        subprocess.run(
+            [python, "-m", "pip", "install", *packages], check=False
+        )
+        subprocess.run([python, "-m", "pip", "list"], check=False)
+    except OSError as error:
+        Logger.error(f"KivyMD: Could not run '{python}': {error}")
 
 
-def check_databases() -> None:
-    databases = {"firebase": "restdb", "restdb": "firebase"}
-    os.remove(
-        os.path.join(
-            path_to_project, "Model", f"database_{databases[name_database]}.py"
+def ignore_unused_files(
+        config: ProjectConfig, path_to_pattern: str, path: str, names: list
+) -> set:
+    """
+    Used as the `ignore` callable of `shutil.copytree` so that pattern files
+    the project will not use are never copied, instead of being copied and
+    then removed.
+    """
+
+    # Matched by the location inside the pattern, so that nested folders
+    # which merely share a name are copied in full.
+    folder = os.path.relpath(path, path_to_pattern)
+    # Bytecode compiled inside the installed pattern is never project source.
+    ignored = {
+        name
+        for name in names
+        if name == "__pycache__" or name.endswith((".pyc", ".pyo"))
+    }
+    if folder == "Model":
+        ignored.update(
+            f"database_{database}.py"
+            for database in available_databases
+            if database != config.name_database
         )
-    )
+    if config.use_localization != "yes":
+        if folder == "libs":
+            ignored.add("translation.py")
+        elif folder == os.curdir:
+            ignored.update(("messages.pot", "data"))
+    return ignored
+
+
+def check_databases(config: ProjectConfig) -> None:
+    path_to_model = os.path.join(config.path_to_project, "Model")
     os.rename(
-        os.path.join(path_to_project, "Model", f"database_{name_database}.py"),
-        os.path.join(path_to_project, "Model", "database.py"),
+        os.path.join(path_to_model, f"database_{config.name_database}.py"),
+        os.path.join(path_to_model, "database.py"),
     )
 
 
+@lru_cache(maxsize=None)
+def _split_camel_case(name: str) -> tuple:
+    # A tuple, so callers can't change what the cache hands out.
+    return tuple(_CAMEL_RE.findall(name))
+
+
 def check_camel_case_name_project(name_project) -> Union[bool, list]:
-    result = re.findall(r"[A-Z][^A-Z]*", name_project)
-    return False if len(result) == 1 else result
+    result = _split_camel_case(name_project)
+    return False if len(result) == 1 else list(result)
+
+
+@lru_cache(maxsize=None)
+def get_module_name(name_screen: str) -> str:
+    """Returns the snake case module name of a camel case screen name."""
+
+    return "_".join(_split_camel_case(name_screen)).lower()
 
 
 def create_argument_parser() -> ArgumentParserWithHelp:
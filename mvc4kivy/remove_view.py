@@ -1,9 +1,12 @@
 import os
-import posixpath
 import re
+from pathlib import Path
 
 from mvc4kivy import ArgumentParserWithHelp
-from mvc4kivy.create_project import check_camel_case_name_project
+from mvc4kivy.create_project import (
+    check_camel_case_name_project,
+    get_module_name,
+)
 from shutil import rmtree
 
 
@@ -17,6 +20,11 @@ screens_comment = """# The screen's dictionary contains the objects of the model
 # of the screens of the application.
 """
 
+_IMPORTS_RE = re.compile(
+    r"from Model.*Model|from Controller.*Controller|from View.*View"
+)
+_CAMEL_RE = re.compile(r"[A-Z][^A-Z]*")
+
 
 def main():
     """The function for removing view(s) to the project."""
@@ -31,14 +39,14 @@ def main():
     if not os.path.exists(path_to_project):
         parser.error(f"Project <{path_to_project}> does not exist...")
 
-    if name_view[-6:] != "Screen":
+    if not name_view.endswith("Screen"):
         parser.error(
             f"The name of the <{name_view}> screen should contain the word "
             f"'Screen' at the end.\n"
             "For example - '--name_screen MyFirstScreen ...'"
         )
 
-    if name_view not in os.listdir(os.path.join(path_to_project, "View")):
+    if not os.path.isdir(os.path.join(path_to_project, "View", name_view)):
         parser.error(
             f"The <{name_view}> view does not exists in the <{path_to_project}> project..."
         )
@@ -49,7 +57,7 @@ def main():
             "The name of the screen should be written in camel case style. "
             "\nFor example - 'MyFirstScreen' or 'FirstScreen'"
         )
-    module_name = "_".join([name.lower() for name in module_name])
+    module_name = get_module_name(name_view)
     remove_view(name_view, module_name, path_to_project)
     update_screens_data(name_view, module_name, path_to_project)
 
@@ -59,12 +67,11 @@ def remove_view(
         module_name: str,
         path_to_project: str
 ) -> None:
-    path_to_view = os.path.join(path_to_project, "View", name_screen)
-    path_to_controller = os.path.join(path_to_project, "Controller", f"{module_name}.py")
-    path_to_model = os.path.join(path_to_project, "Model", f"{module_name}.py")
-    rmtree(path_to_view)
-    os.remove(path_to_controller)
-    os.remove(path_to_model)
+    rmtree(os.path.join(path_to_project, "View", name_screen))
+    # A module that was already deleted by hand must not stop the removal
+    # halfway, before `View/screens.py` is updated.
+    for package in ("Controller", "Model"):
+        Path(path_to_project, package, f"{module_name}.py").unlink(missing_ok=True)
 
 
 def update_screens_data(
@@ -74,39 +81,36 @@ def update_screens_data(
             os.path.join(path_to_project, "View", "screens.py")
     ) as screen_module:
         screen_module = screen_module.read()
-        imports = re.findall(
-            "from Model.*Model|from Controller.*Controller|from View.*View", screen_module
-        )
-        screens = ""
+        imports = _IMPORTS_RE.findall(screen_module)
+        screen_chunks = []
+        append_chunk = screen_chunks.append
         path_to_view = os.path.join(path_to_project, "View")
 
-        for name in os.listdir(path_to_view):
-            if os.path.isdir(os.path.join(path_to_view, name)):
-                res = re.findall(r"[A-Z][^A-Z]*", name)
-                # if res and len(res) == 2 and res[-1] == "Screen":
-                if res and len(res) > 1 and res[-1] == "Screen":
-                    snake_case = "_"
-                    screens += (
-                            "\n    '%s': {"
-                            "\n        'model': %s,"
-                            "\n        'controller': %s,"
-                            "\n        'view': %s,"
-                            "\n        'kv': %s"
-                            "\n    },\n"
-                            % (
-                                f"{' '.join(res).lower()}",
-                                f'{name}Model',
-                                f'{name}Controller',
-                                f'{name}View',
-                                f'"{posixpath.join("./View", name, f"{snake_case.join(res).lower()}.kv")}"',
-                            )
-                    )
-
-        imports.remove(f"from Model.{module_name} import {name_view}Model")
-        imports.remove(
-            f"from Controller.{module_name} import {name_view}Controller"
-        )
-        imports.remove(f"from View.{name_view}.{module_name} import {name_view}View")
+        with os.scandir(path_to_view) as entries:
+            names = [entry.name for entry in entries if entry.is_dir()]
+
+        for name in names:
+            res = _CAMEL_RE.findall(name)
+            # if res and len(res) == 2 and res[-1] == "Screen":
+            if res and len(res) > 1 and res[-1] == "Screen":
+                label = " ".join(res).lower()
+                kv = f"./View/{name}/{get_module_name(name)}.kv"
+                append_chunk(
+                    f"\n    '{label}': {{"
+                    f"\n        'model': {name}Model,"
+                    f"\n        'controller': {name}Controller,"
+                    f"\n        'view': {name}View,"
+                    f"\n        'kv': \"{kv}\""
+                    "\n    },\n"
+                )
+        screens = "".join(screen_chunks)
+
+        removed_imports = {
+            f"from Model.{module_name} import {name_view}Model",
+            f"from Controller.{module_name} import {name_view}Controller",
+            f"from View.{name_view}.{module_name} import {name_view}View",
+        }
+        imports = [line for line in imports if line not in removed_imports]
         imports.insert(0, screens_comment)
         screens = screens_data % ("\n".join(imports), screens)
 